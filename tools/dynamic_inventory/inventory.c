@@ -93,21 +93,16 @@ json_t *convert_ini_line(char *ini_string) {
     // loop through 'key=value' pair and add them to 'vars' dict
     while (key_ptr = strtok_r(rest, " ", &rest)) {
 
-        // copy key_ptr to key and strip it accoridingly
-        char *key = malloc(strlen(key_ptr));
-        strcpy(key, key_ptr);
-        key = strtok(key, "=");
-
-        // get the value
+        // get the value, splitting the pair in place (key_ptr becomes the key)
         value_ptr = strchr(key_ptr, '=');
         if (value_ptr) {
             // got a key=value pair, move away from '=' in value_ptr
             *value_ptr = '\0';
             value_ptr++;
-            json_object_set_new(vars_obj, key, json_string(value_ptr));
+            json_object_set_new(vars_obj, key_ptr, json_string(value_ptr));
         } else {
             // only key, no value
-            json_object_set_new(vars_obj, key, json_string(""));
+            json_object_set_new(vars_obj, key_ptr, json_string(""));
         }
     }
 
@@ -166,9 +161,9 @@ json_t *parse_hosts_ini(const char *filename) {
 
     int groups_flag = 0; // flag to read all ungrouped entries
     while ((read_chars = getline(&line, &buffer_length, ini_file)) != -1 ) {
-        // remove the '\n's
-        if (line[strlen(line) - 1] == '\n')
-            line[strlen(line) - 1] = '\0';
+        // remove the '\n's, getline() already returned the line length
+        if (read_chars > 0 && line[read_chars - 1] == '\n')
+            line[read_chars - 1] = '\0';
 
         // ignore empty lines
         if (line[0] == '\0')
@@ -245,12 +240,11 @@ json_t *parse_hosts_ini(const char *filename) {
 const char *host(char *hostname, json_t *root_json) {
     // returns a hostname dictionary from a JSON object 
 
-    // init en empty output JSON dictionary, and a char pointer for return value
-    json_t *output_dict = json_object();
-    char *output; 
+    // char pointer for return value
+    char *output;
 
     // test find_dict()
-    output_dict = find_dict(root_json, hostname);
+    json_t *output_dict = find_dict(root_json, hostname);
 
     // return the output dictionary 
     output = json_dumps(output_dict, JSON_INDENT(2));
@@ -289,10 +283,9 @@ int main(int argc, char *argv[]) {
             
             // execute the --list command
             if (strcmp(argv[1], "--list") == 0 || strcmp(argv[1], "-l") == 0) {
-                char *json_str;
-                json_str = json_dumps(root, JSON_INDENT(2));
-                printf("%s\n", json_str);
-                free(json_str);
+                // stream the inventory straight to stdout, no intermediate string
+                json_dumpf(root, stdout, JSON_INDENT(2));
+                printf("\n");
             }
 
             // execute the --host command
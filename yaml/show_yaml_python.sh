@@ -6,4 +6,4 @@ file="test.yaml"
 echo "-- Reading ${file}"
 echo ""
 
-python3 -c "import yaml,pprint;pprint.pprint(yaml.load(open(\"${file}\").read(), Loader=yaml.FullLoader))"
+python3 -c "import yaml,pprint;pprint.pprint(yaml.load(open(\"${file}\", \"rb\"), Loader=getattr(yaml, \"CFullLoader\", yaml.FullLoader)))"